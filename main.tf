@@ -83,8 +83,11 @@ resource "aws_lambda_function" "user_writer" {
   filename      = "${path.module}/sample-project/lambda/create-user/build.zip"
   # Ensure Terraform detects changes to the lambda package by hashing the zip
   source_code_hash = filebase64sha256("${path.module}/sample-project/lambda/create-user/build.zip")
-  memory_size      = var.lambda_memory_mb
-  timeout          = var.lambda_timeout_s
+  # CPU scales with memory; 1769 MB is one full vCPU and is the starting point
+  # for cold start (imports, TLS). Re-check with Lambda Power Tuning at
+  # 256/512/1024/1769/2048 MB and record the results here before lowering it.
+  memory_size = var.lambda_writer_memory_mb
+  timeout     = var.lambda_timeout_s
 
   environment {
     variables = {
@@ -17,6 +17,12 @@ variable "lambda_memory_mb" {
   default     = 256
 }
 
+variable "lambda_writer_memory_mb" {
+  description = "Memory in MB for the create-user Lambda (1769 MB = one full vCPU)"
+  type        = number
+  default     = 1769
+}
+
 variable "lambda_timeout_s" {
   description = "Lambda timeout in seconds"
   type        = number